@@ -0,0 +1,200 @@
+import argparse
+import cProfile
+import io
+import itertools
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from qr_generator import EC_MAP, build_qr
+
+try:
+    import resource  # Unix only - peak RSS is reported as null on Windows.
+except ImportError:
+    resource = None
+
+# DEFAULT SWEEP - EACH COMBINATION BECOMES ONE SCENARIO
+DEFAULT_LENGTHS = [32, 128, 512]
+DEFAULT_EC = ["L", "M", "Q", "H"]
+DEFAULT_BOX_SIZES = [10, 20]
+DEFAULT_BORDERS = [4]
+
+# BUILD A SYNTHETIC URL OF EXACTLY `length` CHARACTERS
+def synthetic_url(length: int, seed: int = 0) -> str:
+    prefix = f"https://example.com/{seed}/"
+    if length <= len(prefix):
+        return prefix[:length]
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    body = "".join(alphabet[(seed + i) % len(alphabet)] for i in range(length - len(prefix)))
+    return prefix + body
+
+# RUN ONE QR GENERATION AND TIME EACH PHASE: ENCODE -> RENDER -> PNG COMPRESSION
+def run_once(url: str, error_correction: str, box_size: int, border: int) -> dict:
+    t0 = time.perf_counter()
+    qr = build_qr(url, error_correction, box_size, border)  # Same encode path as the CLI and sheet tools.
+    t1 = time.perf_counter()
+
+    img = qr.make_image(fill_color= "black", back_color= "white")
+    t2 = time.perf_counter()
+
+    buf = io.BytesIO()  # Save to memory so disk speed does not pollute the PNG timing.
+    img.save(buf, format= "PNG")
+    t3 = time.perf_counter()
+
+    return {
+        "encode": t1 - t0,
+        "render": t2 - t1,
+        "png": t3 - t2,
+        "bytes": buf.tell(),
+        "version": qr.version,
+        "pixels": img.size[0],
+    }
+
+# READ THE PEAK RESIDENT MEMORY OF THIS PROCESS IN BYTES
+def peak_rss_bytes() -> int:
+    # On Linux ru_maxrss carries the parent's peak over into a child process, so read VmHWM instead.
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KB on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+# CHILD PROCESS: IMPORT EVERYTHING, RECORD PEAK RSS, GENERATE ONE QR CODE, RECORD PEAK RSS AGAIN
+_RSS_PROBE = """
+import json, sys
+from qr_benchmark import peak_rss_bytes, run_once, synthetic_url
+length, ec, box, border = int(sys.argv[1]), sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+url = synthetic_url(length)
+before = peak_rss_bytes()
+run_once(url, ec, box, border)
+print(json.dumps({"before": before, "after": peak_rss_bytes()}))
+"""
+
+# MEASURE PEAK RSS IN A FRESH PROCESS - THIS INCLUDES PILLOW'S PIXEL BUFFERS, WHICH tracemalloc CANNOT SEE
+def measure_peak_rss(length: int, error_correction: str, box_size: int, border: int) -> dict:
+    if resource is None:
+        return {"peak_rss_bytes": None, "peak_rss_growth_bytes": None}
+    result = subprocess.run(
+        [sys.executable, "-c", _RSS_PROBE, str(length), error_correction, str(box_size), str(border)],
+        cwd= Path(__file__).resolve().parent,
+        capture_output= True,
+        text= True,
+        check= True,)
+    rss = json.loads(result.stdout)
+    # Growth = memory used by the QR generation itself, on top of the interpreter and imports.
+    return {"peak_rss_bytes": rss["after"], "peak_rss_growth_bytes": rss["after"] - rss["before"]}
+
+# RUN ONE SCENARIO `iterations` TIMES AND SUMMARISE THE RESULTS
+def run_scenario(length: int, error_correction: str, box_size: int, border: int,
+                 iterations: int, warmup: int = 1) -> dict:
+    urls = [synthetic_url(length, seed= i) for i in range(iterations)]
+
+    for url in urls[:warmup]:  # Warm-up runs are not counted.
+        run_once(url, error_correction, box_size, border)
+
+    runs = [run_once(url, error_correction, box_size, border) for url in urls]
+
+    # Python heap peak is measured on a separate run - tracemalloc slows everything down.
+    # It only sees Python objects; the image pixel buffers show up in the RSS figures instead.
+    tracemalloc.start()
+    run_once(urls[0], error_correction, box_size, border)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    phases = {}
+    for phase in ("encode", "render", "png"):
+        values = sorted(r[phase] for r in runs)
+        phases[phase] = {
+            "mean_ms": 1000 * sum(values) / len(values),
+            "min_ms": 1000 * values[0],
+            "max_ms": 1000 * values[-1],
+        }
+    total = sum(r["encode"] + r["render"] + r["png"] for r in runs)
+
+    return {
+        "payload_length": length,
+        "error_correction": error_correction,
+        "box_size": box_size,
+        "border": border,
+        "iterations": iterations,
+        "qr_version": runs[0]["version"],
+        "image_pixels": runs[0]["pixels"],
+        "phases": phases,
+        "images_per_sec": len(runs) / total if total else None,
+        "output_bytes_mean": sum(r["bytes"] for r in runs) / len(runs),
+        "python_heap_peak_bytes": peak,
+        **measure_peak_rss(length, error_correction, box_size, border),
+    }
+
+# PROFILE ONE SCENARIO WITH cProfile AND DUMP THE STATS FILE
+def profile_scenario(profile_dir: Path, length: int, error_correction: str,
+                     box_size: int, border: int, iterations: int) -> Path:
+    profile_dir.mkdir(parents= True, exist_ok= True)
+    out = profile_dir / f"len{length}_ec{error_correction}_box{box_size}_border{border}.prof"
+    urls = [synthetic_url(length, seed= i) for i in range(iterations)]
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for url in urls:
+        run_once(url, error_correction, box_size, border)
+    profiler.disable()
+    profiler.dump_stats(out)
+    return out
+
+# DEFINE ALL THE COMMAND-LINE OPTIONS USERS CAN PASS IN.
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description= "Benchmark QR code generation across payload length, EC level, box size and border.")
+
+    parser.add_argument("--lengths", type=int, nargs="+", default= DEFAULT_LENGTHS, help= f"Payload lengths in characters. Default: {DEFAULT_LENGTHS}",)
+
+    parser.add_argument("--ec", choices= list(EC_MAP.keys()), nargs="+", default= DEFAULT_EC, help= f"Error-correction levels. Default: {DEFAULT_EC}",)
+
+    parser.add_argument("--box-sizes", type=int, nargs="+", default= DEFAULT_BOX_SIZES, help= f"Box sizes in pixels. Default: {DEFAULT_BOX_SIZES}",)
+
+    parser.add_argument("--borders", type=int, nargs="+", default= DEFAULT_BORDERS, help= f"Border widths in boxes. Default: {DEFAULT_BORDERS}",)
+
+    parser.add_argument("--iterations", type=int, default= 20, help= "Timed runs per scenario. Default: 20",)
+
+    parser.add_argument("--out", default= None, help= "Write the JSON report to this file instead of stdout.",)
+
+    parser.add_argument("--profile-dir", default= None, help= "If set, dump one cProfile .prof file per scenario into this folder.",)
+
+    return parser.parse_args()
+
+# ENTRY POINT
+def main() -> int:
+    args = parse_args()
+    if args.iterations < 1:
+        print("Fail!! Error: --iterations must be at least 1", file=sys.stderr)
+        return 1
+
+    scenarios = []
+    for length, ec, box, border in itertools.product(args.lengths, args.ec, args.box_sizes, args.borders):
+        try:
+            result = run_scenario(length, ec, box, border, args.iterations)
+        except Exception as exc:  # e.g. payload too long for any QR version at this EC level
+            result = {"payload_length": length, "error_correction": ec, "box_size": box,
+                      "border": border, "error": str(exc)}
+        else:
+            if args.profile_dir:
+                result["profile"] = str(profile_scenario(Path(args.profile_dir), length, ec, box, border, args.iterations))
+        scenarios.append(result)
+        print(f"Done: len={length} ec={ec} box={box} border={border}", file=sys.stderr)
+
+    report = json.dumps({"python": sys.version.split()[0], "scenarios": scenarios}, indent= 2)
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents= True, exist_ok= True)
+        out_path.write_text(report)
+        print(f"Sucesful!! Benchmark report written: {out_path.resolve()}", file=sys.stderr)
+    else:
+        print(report)
+    return 0
+
+# PROGRAM ENTRY CHECK:
+if __name__ == "__main__":
+    raise SystemExit(main())
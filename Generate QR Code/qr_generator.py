@@ -1,9 +1,16 @@
 import argparse
+import base64
+import io
+import json
 import os
+import struct
+import sys
 from pathlib import Path
 from urllib.parse import urlparse
 import qrcode
 from qrcode.constants import ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H
+from qrcode.image.svg import SvgPathImage
+from PIL import ImageColor
 
 # DEFINE THE ERROR - CORRECTION DICTIONARY
 EC_MAP ={
@@ -25,6 +32,26 @@ def is_valid_url(url: str) -> bool:
 def ensure_png_suffix(path: Path) -> Path:
      return path if path.suffix.lower() == ".png" else path.with_suffix(".png")
 
+# CREATE AND FIT A QR OBJECT FOR ANY PAYLOAD - SHARED BY THE CLI, SHEET AND BENCHMARK TOOLS
+def build_qr(
+          data: str,
+          error_correction: str ="M",
+          box_size: int =20,
+          border: int = 4,) -> qrcode.QRCode:
+
+     if error_correction not in EC_MAP:  # Make sure the user picked a valid error correction level (L/M/Q/H).
+          raise ValueError(f"error-correction must be one of {list(EC_MAP.keys())}")
+
+     qr = qrcode.QRCode(
+          version = None,
+          error_correction= EC_MAP[error_correction],
+          box_size= box_size,
+          border= border,)
+
+     qr.add_data(data)
+     qr.make(fit=True)
+     return qr
+
 # GENERATING QR CODE - MAIN FUNCTION
 def generate_qr(
           url: str,
@@ -45,28 +72,76 @@ def generate_qr(
      out_path.parent.mkdir(parents= True, exist_ok= True)
 
      # Creating QR object:
-     qr = qrcode.QRCode(
-          version = None,
-          error_correction= EC_MAP[error_correction],
-          box_size= box_size,
-          border= border,)
-     
-     qr.add_data(url)
-     qr.make(fit=True)
+     qr = build_qr(url, error_correction, box_size, border)
      img = qr.make_image(fill_color = fill_color, back_color = back_color)
      img.save(out_path)
 
      return out_path
 
+# RENDER A QR CODE TO PNG OR SVG BYTES IN MEMORY - NOTHING IS WRITTEN TO DISK
+def render_qr_bytes(
+          url: str,
+          fmt: str = "png",
+          error_correction: str ="M",
+          box_size: int =20,
+          border: int = 4,
+          fill_color: str = "black",
+          back_color: str ="white",) -> bytes:
+
+     if not is_valid_url(url):
+          raise ValueError(f"Invalid URL: '{url}'")
+
+     qr = build_qr(url, error_correction, box_size, border)
+     buf = io.BytesIO()
+     if fmt == "svg":  # SVG output is always black on transparent.
+          qr.make_image(image_factory= SvgPathImage).save(buf)
+     elif fmt == "png":
+          qr.make_image(fill_color = fill_color, back_color = back_color).save(buf, format= "PNG")
+     else:
+          raise ValueError("format must be 'png' or 'svg'")
+     return buf.getvalue()
+
+# STREAM MODE: READ ONE URL PER LINE, WRITE EXACTLY ONE RECORD PER INPUT LINE (BLANK LINES ARE ERRORS)
+# "length" framing: 4-byte big-endian size + image bytes (size 0 means that line failed).
+# "jsonl" framing: {"url": ..., "format": ..., "data": <base64>} or {"url": ..., "error": ...}
+def stream_qr(in_stream, out_stream, fmt: str = "png", framing: str = "length", **options) -> int:
+     for color in (options.get("fill_color", "black"), options.get("back_color", "white")):
+          ImageColor.getrgb(color)  # Fail once up front instead of on every line.
+
+     failures = 0
+     for line in in_stream:
+          url = line.strip()
+          try:
+               if not url:
+                    raise ValueError("Empty line")
+               data = render_qr_bytes(url, fmt, **options)
+               error = None
+          except Exception as exc:
+               data, error = b"", str(exc)
+               failures += 1
+               print(f"Fail!! Error: {exc}", file=sys.stderr)
+
+          try:
+               if framing == "jsonl":
+                    record = {"url": url, "error": error} if error is not None else {"url": url, "format": fmt, "data": base64.b64encode(data).decode("ascii")}
+                    out_stream.write(json.dumps(record).encode("utf-8") + b"\n")
+               else:
+                    out_stream.write(struct.pack(">I", len(data)))
+                    out_stream.write(data)
+               out_stream.flush()  # The consumer gets each record as soon as it is ready.
+          except BrokenPipeError:  # The consumer closed the pipe (e.g. "| head") - stop quietly.
+               break
+     return failures
+
 # DEFINE ALL THE COMMAND-LINE OPTIONS USERS CAN PASS IN.
 def parse_args() -> argparse.Namespace:
      parser = argparse.ArgumentParser(description= "Generate a QR code PNG for a given URL.")
 
-     parser.add_argument("--url", required= True, help= "URL to encode (e.g., https://example.com).",)
+     parser.add_argument("--url", help= "URL to encode (e.g., https://example.com). Required unless --stream is used.",)
 
      parser.add_argument("--out", default= "out/qrcode.png", help= "Output PNG path (default: out/qrcode.png).",)
 
-     parser.add_argument("--ec", choices= list(EC_MAP.keys()), default= "M", help= "Error-correction level: L(7%), M(15%), Q(25%), H(30%). Default: M",)
+     parser.add_argument("--ec", choices= list(EC_MAP.keys()), default= "M", help= "Error-correction level: L(7%%), M(15%%), Q(25%%), H(30%%). Default: M",)
      
      parser.add_argument("--box-size", type=int, default=10, help="Pixel size of each QR box. Default: 10",)
      
@@ -76,11 +151,44 @@ def parse_args() -> argparse.Namespace:
      
      parser.add_argument("--back", default="white", help='Background color (e.g., "white", "#FFFFFF").',) 
 
+     parser.add_argument("--stream", action="store_true", help="Read URLs line by line from stdin and write images to stdout (no files).",)
+
+     parser.add_argument("--format", choices= ["png", "svg"], default= "png", help="Stream mode image format. Default: png",)
+
+     parser.add_argument("--framing", choices= ["length", "jsonl"], default= "length", help="Stream mode output: length-prefixed bytes or base64 JSON lines. Default: length",)
+
      return parser.parse_args()
 
 # ENTRY POINT
 def main() -> int:
      args = parse_args()
+     if args.stream:
+          try:
+               failures = stream_qr(
+                    sys.stdin,
+                    sys.stdout.buffer,
+                    fmt= args.format,
+                    framing= args.framing,
+                    error_correction= args.ec,
+                    box_size= args.box_size,
+                    border= args.border,
+                    fill_color= args.fill,
+                    back_color= args.back,)
+          except Exception as exc:
+               print(f"Fail!! Error: {exc}", file=sys.stderr)
+               return 1
+          try:
+               sys.stdout.flush()
+          except BrokenPipeError:
+               # stdout is a closed pipe: point it at devnull so Python's own flush at exit does not raise again.
+               devnull = os.open(os.devnull, os.O_WRONLY)
+               os.dup2(devnull, sys.stdout.fileno())
+               os.close(devnull)
+          return 1 if failures else 0
+
+     if not args.url:
+          print("Fail!! Error: --url is required (or use --stream)", file=sys.stderr)
+          return 1
      try:
           out_path = generate_qr(
                url= args.url,
@@ -99,7 +207,7 @@ def main() -> int:
      
 # PROGRAM ENTRY CHECK:
 if __name__ == "__main__":
-     SystemExit(main())
+     raise SystemExit(main())
 
      
 
@@ -0,0 +1,262 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+from qr_generator import EC_MAP, build_qr
+
+# PAGE SIZES IN MILLIMETRES (WIDTH, HEIGHT)
+PAGE_SIZES_MM = {
+    "A4": (210.0, 297.0),
+    "LETTER": (215.9, 279.4),
+}
+
+# CONVERT MILLIMETRES TO PIXELS AT THE GIVEN DPI
+def mm_to_px(mm: float, dpi: int) -> int:
+    return int(round(mm * dpi / 25.4))
+
+# CONVERT A FONT SIZE IN POINTS (1/72 INCH) TO PIXELS AT THE GIVEN DPI
+def pt_to_px(pt: float, dpi: int) -> int:
+    return max(1, int(round(pt * dpi / 72)))
+
+# READ PAYLOADS ONE PER LINE - "payload<TAB>caption" SETS A CUSTOM CAPTION
+# Yields (line number, payload, caption) so problems can be reported against the input file.
+def read_labels(lines: Iterable[str]) -> Iterator[Tuple[int, str, str]]:
+    for line_no, line in enumerate(lines, start= 1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        payload, _, caption = line.partition("\t")
+        yield line_no, payload, caption or payload
+
+# GROUP ITEMS INTO PAGES WITHOUT READING THE WHOLE INPUT FIRST
+def chunk(items: Iterable, size: int) -> Iterator[List]:
+    page = []
+    for item in items:
+        page.append(item)
+        if len(page) == size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+# CUT A CAPTION DOWN SO IT FITS INSIDE ONE CELL
+def fit_caption(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
+    if draw.textlength(text, font= font) <= max_width:
+        return text
+    while text and draw.textlength(text + "...", font= font) > max_width:
+        text = text[:-1]
+    return text + "..." if text else ""
+
+# TILES QR MODULE MATRICES STRAIGHT INTO ONE PRE-ALLOCATED PAGE IMAGE
+class SheetLayout:
+    def __init__(
+            self,
+            page: str = "A4",
+            dpi: int = 300,
+            cols: int = 4,
+            rows: int = 6,
+            margin_mm: float = 10.0,
+            gap_mm: float = 4.0,
+            captions: bool = False,
+            caption_pt: float = 8.0,
+            error_correction: str = "M",
+            box_size: int = 10,
+            border: int = 4,
+            fill_color: str = "black",
+            back_color: str = "white",):
+
+        if page.upper() not in PAGE_SIZES_MM:
+            raise ValueError(f"page must be one of {list(PAGE_SIZES_MM.keys())}")
+        if cols < 1 or rows < 1:
+            raise ValueError("cols and rows must be at least 1")
+        if error_correction not in EC_MAP:
+            raise ValueError(f"error-correction must be one of {list(EC_MAP.keys())}")
+        if box_size < 1:
+            raise ValueError("box-size must be at least 1")
+        if border < 0:
+            raise ValueError("border must be 0 or more")
+
+        width_mm, height_mm = PAGE_SIZES_MM[page.upper()]
+        self.dpi = dpi
+        self.page_size = (mm_to_px(width_mm, dpi), mm_to_px(height_mm, dpi))
+        self.cols = cols
+        self.rows = rows
+        self.margin = mm_to_px(margin_mm, dpi)
+        self.gap = mm_to_px(gap_mm, dpi)
+        self.captions = captions
+        self.error_correction = error_correction
+        self.box_size = box_size
+        self.border = border
+        self.fill = ImageColor.getrgb(fill_color)
+        self.back = ImageColor.getrgb(back_color)
+        # Caption font is sized in points so it prints at the same size at any dpi.
+        self.font = ImageFont.load_default(size= pt_to_px(caption_pt, dpi))
+        text_bottom = self.font.getbbox("Ag")[3]  # Real height of the caption text, including descenders.
+        self.caption_height = (text_bottom + self.gap // 2) if captions else 0
+
+        # Every cell gets the same size; the QR code is centred inside its cell.
+        self.cell_w = (self.page_size[0] - 2 * self.margin - (cols - 1) * self.gap) // cols
+        self.cell_h = (self.page_size[1] - 2 * self.margin - (rows - 1) * self.gap) // rows
+        self.code_area = min(self.cell_w, self.cell_h - self.caption_height)
+        if self.code_area < 1:
+            raise ValueError("Grid does not fit on the page - reduce rows/cols, margins or gap.")
+        # Every code on the sheet uses the same module size, so even the smallest code (version 1) must fit.
+        if (21 + 2 * border) * box_size > self.code_area:
+            raise ValueError(f"box-size {box_size} is too large for a {self.code_area}px cell - reduce box-size or rows/cols")
+
+    @property
+    def per_page(self) -> int:
+        return self.cols * self.rows
+
+    # RENDER ONE QR CODE AS A MASK: WHITE WHERE THE DARK MODULES GO
+    def module_mask(self, payload: str) -> Image.Image:
+        try:
+            matrix = build_qr(payload, self.error_correction, self.box_size, self.border).get_matrix()
+        except ValueError as exc:
+            if "Invalid version" not in str(exc):  # Only the "data does not fit" error gets a friendlier message.
+                raise
+            raise ValueError(f"Payload too long for a QR code at error-correction {self.error_correction} ({len(payload)} characters)") from exc
+        n = len(matrix)
+        # The module size is fixed for the whole layout, so codes never print at mixed scales.
+        size = n * self.box_size
+        if size > self.code_area:
+            raise ValueError(f"QR code is {size}px at box-size {self.box_size} but the cell is {self.code_area}px - lower box-size or use fewer rows/cols")
+        small = Image.frombytes("L", (n, n), bytes(255 if cell else 0 for row in matrix for cell in row))
+        return small.resize((size, size), Image.NEAREST)
+
+    # DRAW ONE FULL PAGE FROM ALREADY ENCODED (MASK, CAPTION) TILES
+    def render_page(self, tiles: List[Tuple[Image.Image, str]]) -> Image.Image:
+        page = Image.new("RGB", self.page_size, self.back)
+        draw = ImageDraw.Draw(page) if self.captions else None
+
+        for index, (mask, caption) in enumerate(tiles):
+            row, col = divmod(index, self.cols)
+            x0 = self.margin + col * (self.cell_w + self.gap)
+            y0 = self.margin + row * (self.cell_h + self.gap)
+
+            x = x0 + (self.cell_w - mask.width) // 2
+            y = y0 + (self.code_area - mask.height) // 2
+            page.paste(self.fill, (x, y, x + mask.width, y + mask.height), mask)
+
+            if draw is not None:
+                text = fit_caption(draw, caption, self.font, self.cell_w)
+                text_x = x0 + (self.cell_w - int(draw.textlength(text, font= self.font))) // 2
+                draw.text((text_x, y + mask.height + self.gap // 4), text, fill= self.fill, font= self.font)
+
+        return page
+
+# RENDER ALL PAGES AND WRITE THEM ONE AT A TIME - ONLY ONE PAGE IS EVER IN MEMORY
+# Labels that cannot be encoded are skipped (they take no cell) and returned as (line number, reason).
+def generate_sheets(labels: Iterable[Tuple[int, str, str]], out_path: Path, layout: SheetLayout) -> Tuple[List[Path], List[Tuple[int, str]]]:
+    suffix = out_path.suffix.lower()
+    if suffix not in (".pdf", ".png"):
+        raise ValueError("Output file must end with .pdf or .png")
+    out_path.parent.mkdir(parents= True, exist_ok= True)
+
+    skipped = []
+
+    def tiles():
+        for line_no, payload, caption in labels:
+            try:
+                mask = layout.module_mask(payload)
+            except ValueError as exc:
+                skipped.append((line_no, str(exc)))
+                continue
+            yield mask, caption
+
+    written = []
+    for number, page_tiles in enumerate(chunk(tiles(), layout.per_page), start= 1):
+        page = layout.render_page(page_tiles)
+        if suffix == ".pdf":
+            # Pages after the first are appended to the same PDF file.
+            page.save(out_path, format= "PDF", resolution= layout.dpi, append= number > 1)
+            if number == 1:
+                written.append(out_path)
+        else:
+            page_path = out_path.with_name(f"{out_path.stem}_{number:03d}.png")
+            page.save(page_path, format= "PNG", dpi= (layout.dpi, layout.dpi))
+            written.append(page_path)
+        page.close()
+
+    return written, skipped
+
+# DEFINE ALL THE COMMAND-LINE OPTIONS USERS CAN PASS IN.
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description= "Tile many QR codes onto printable sheets (multi-page PDF or PNG).")
+
+    parser.add_argument("--input", default= "-", help= 'Text file with one payload per line ("-" reads stdin). Use "payload<TAB>caption" for custom captions.',)
+
+    parser.add_argument("--out", default= "out/sheet.pdf", help= "Output .pdf (one multi-page file) or .png (one file per page). Default: out/sheet.pdf",)
+
+    parser.add_argument("--page", choices= list(PAGE_SIZES_MM.keys()), type= str.upper, default= "A4", help= "Page size. Default: A4",)
+
+    parser.add_argument("--dpi", type=int, default=300, help="Print resolution. Default: 300",)
+
+    parser.add_argument("--cols", type=int, default=4, help="QR codes per row. Default: 4",)
+
+    parser.add_argument("--rows", type=int, default=6, help="QR codes per column. Default: 6",)
+
+    parser.add_argument("--margin", type=float, default=10.0, help="Page margin in mm. Default: 10",)
+
+    parser.add_argument("--gap", type=float, default=4.0, help="Space between labels in mm. Default: 4",)
+
+    parser.add_argument("--captions", action="store_true", help="Print the payload (or custom caption) under each QR code.",)
+
+    parser.add_argument("--caption-size", type=float, default=8.0, help="Caption font size in points. Default: 8",)
+
+    parser.add_argument("--ec", choices= list(EC_MAP.keys()), default= "M", help= "Error-correction level: L(7%%), M(15%%), Q(25%%), H(30%%). Default: M",)
+
+    parser.add_argument("--box-size", type=int, default=10, help="Pixel size of each QR box, the same for every code on the sheet. Default: 10",)
+
+    parser.add_argument("--border", type=int, default=4, help="Border width (boxes). Default: 4",)
+
+    parser.add_argument("--fill", default="black", help='Foreground color (e.g., "black", "#000000").',)
+
+    parser.add_argument("--back", default="white", help='Background color (e.g., "white", "#FFFFFF").',)
+
+    return parser.parse_args()
+
+# ENTRY POINT
+def main() -> int:
+    args = parse_args()
+    try:
+        layout = SheetLayout(
+            page= args.page,
+            dpi= args.dpi,
+            cols= args.cols,
+            rows= args.rows,
+            margin_mm= args.margin,
+            gap_mm= args.gap,
+            captions= args.captions,
+            caption_pt= args.caption_size,
+            error_correction= args.ec,
+            box_size= args.box_size,
+            border= args.border,
+            fill_color= args.fill,
+            back_color= args.back,)
+
+        if args.input == "-":
+            written, skipped = generate_sheets(read_labels(sys.stdin), Path(args.out), layout)
+        else:
+            with open(args.input, encoding= "utf-8") as handle:
+                written, skipped = generate_sheets(read_labels(handle), Path(args.out), layout)
+
+        for path in written:
+            print(f"Sucesful!! Sheet written: {path.resolve()}")
+        for line_no, reason in skipped:
+            print(f"Skipped line {line_no}: {reason}", file=sys.stderr)
+        if not written:
+            print("Fail!! Error: No payloads to print.", file=sys.stderr)
+            return 1
+        if skipped:
+            print(f"Fail!! {len(skipped)} label(s) skipped - see the lines above.", file=sys.stderr)
+            return 1
+        return 0
+    except Exception as exc:
+        print(f"Fail!! Error: {exc}", file=sys.stderr)
+        return 1
+
+# PROGRAM ENTRY CHECK:
+if __name__ == "__main__":
+    raise SystemExit(main())